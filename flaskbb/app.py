@@ -74,6 +74,7 @@ from flaskbb.utils.helpers import (
     time_utcnow,
     topic_is_unread,
 )
+from flaskbb.utils.http import canonical_hosts
 
 # permission checks (here they are used for the jinja filters)
 from flaskbb.utils.requirements import (
@@ -174,6 +175,10 @@ def configure_app(app: Flask, config: Any):
     # them on the config object
     app_config_from_env(app, prefix="FLASKBB_")
 
+    # Hosts are compared case-insensitively when validating redirects;
+    # canonicalize them once here instead of on every redirect
+    app.config["ALLOWED_HOSTS"] = canonical_hosts(app.config["ALLOWED_HOSTS"])
+
     # Migrate Celery 4.x config to Celery 6.x
     old_celery_config = app.config.get_namespace("CELERY_")
     celery_config = {}
@@ -10,6 +10,7 @@ commands.
 """
 
 import importlib.metadata
+import importlib.util
 import os
 import re
 import sys
@@ -24,7 +25,7 @@ from flaskbb import __version__
 from flaskbb.extensions import pluggy
 from flaskbb.utils.populate import create_user, update_user
 
-_email_regex = r"[^@]+@[^@]+\.[^@]+"
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
 
 
 class FlaskBBCLIError(click.ClickException):
@@ -56,7 +57,7 @@ class EmailType(click.ParamType):
     @override
     def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None):
         # Exact match
-        if re.match(_email_regex, value):
+        if _EMAIL_RE.fullmatch(value):
             return value
         else:
             self.fail((f"invalid email: {value}"), param, ctx)
@@ -88,20 +89,17 @@ def validate_theme(theme: str):
 
 
 def get_cookiecutter() -> object:
-    cookiecutter_available = False
-    try:
-        from cookiecutter.main import cookiecutter  # pyright: ignore
-
-        cookiecutter_available = True
-    except ImportError:
-        pass
-
-    if not cookiecutter_available:
+    # Check for cookiecutter without importing it, as that pulls in quite a
+    # few dependencies of its own.
+    if importlib.util.find_spec("cookiecutter") is None:
         raise FlaskBBCLIError(
             "Can't continue because cookiecutter is not installed. "
             + "You can install it with 'pip install cookiecutter'.",
             fg="red",
         )
+
+    from cookiecutter.main import cookiecutter  # pyright: ignore
+
     return cookiecutter  # pyright: ignore
 
 
@@ -203,4 +201,4 @@ def write_config(config: dict[str, bool | str | int], config_template: Template,
     :param config_path: The place to write the new config file.
     """
     with open(config_path, "wb") as cfg_file:
-        cfg_file.write(config_template.render(**config).encode("utf-8"))
+        config_template.stream(config).dump(cfg_file, encoding="utf-8")
@@ -17,6 +17,7 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
+from flask import g, has_app_context
 from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -106,6 +107,9 @@ class Setting(db.Model):
     def invalidate_cache(cls):
         """Invalidates this objects cached metadata."""
         cache.delete(_SETTINGS_CACHE_KEY)
+        if has_app_context():
+            # drop the per-request copy held by flaskbb_config as well
+            g.pop("_flaskbb_settings", None)
 
     @classmethod
     def update(
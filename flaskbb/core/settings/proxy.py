@@ -11,27 +11,47 @@ Supports both:
 """
 
 import logging
-from collections.abc import Iterator, MutableMapping
+from collections.abc import ItemsView, Iterator, KeysView, MutableMapping, ValuesView
 from typing import Any, override
 
+from flask import g, has_request_context
+
 from .models import Setting
 from .registry import setting_registry
 
 logger = logging.getLogger(__name__)
 
 
+def _settings() -> dict[str, Any]:
+    """Returns the settings dict, materialized at most once per request.
+
+    ``Setting.as_dict()`` goes through the cache backend on every call,
+    which adds up quickly as templates read dozens of settings per
+    request. The dict is kept on ``g`` for the rest of the request and
+    dropped again by ``Setting.invalidate_cache()``.
+    """
+    if not has_request_context():
+        return Setting.as_dict()
+
+    settings = g.get("_flaskbb_settings")
+    if settings is None:
+        settings = Setting.as_dict()
+        g._flaskbb_settings = settings
+    return settings
+
+
 class FlaskBBConfigProxy(MutableMapping[str, Any]):
     def __getattr__(self, key: str):
         # only invoked when normal attribute lookup fails
         try:
-            return Setting.as_dict()[key.upper()]
+            return _settings()[key.upper()]
         except KeyError as e:
             raise AttributeError(f"No such setting: {key!r}") from e
 
     @override
     def __getitem__(self, key: str):
         try:
-            return Setting.as_dict()[key.upper()]
+            return _settings()[key.upper()]
         except KeyError:
             logger.warning(f"No such setting: {key!r}")
             return None
@@ -55,15 +75,33 @@ class FlaskBBConfigProxy(MutableMapping[str, Any]):
 
     @override
     def __iter__(self) -> Iterator[str]:
-        return iter(Setting.as_dict())
+        return iter(_settings())
 
     @override
     def __len__(self) -> int:
-        return len(Setting.as_dict())
+        return len(_settings())
 
     @override
     def get(self, key: str, default: Any | None = None):
-        return Setting.as_dict().get(key.upper(), default)
+        return _settings().get(key.upper(), default)
+
+    # The Mapping mixins below would otherwise go through __getitem__ (and so
+    # through the settings lookup) once per key.
+    @override
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.upper() in _settings()
+
+    @override
+    def keys(self) -> KeysView[str]:
+        return _settings().keys()
+
+    @override
+    def values(self) -> ValuesView[Any]:
+        return _settings().values()
+
+    @override
+    def items(self) -> ItemsView[str, Any]:
+        return _settings().items()
 
     @override
     def update(self, other=(), /, **kwargs: dict[str, Any]) -> None:  # pyright: ignore
@@ -59,7 +59,7 @@ def deprecated(message: str = "", category: type[FlaskBBDeprecation] = RemovedIn
         if provided must be a subclass of FlaskBBDeprecation.
     """
 
-    def deprecation_decorator(f: Callable[..., None]):
+    def deprecation_decorator(f: Callable[..., Any]):
         if not issubclass(category, FlaskBBDeprecation):
             raise ValueError(
                 f"Expected subclass of FlaskBBDeprecation for category, got {str(category)}"
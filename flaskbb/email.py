@@ -57,6 +57,20 @@ def send_async_email(*args: Any, **kwargs: Any):
     send_email(*args, **kwargs)
 
 
+@celery.task
+def send_email_batch(messages: list[dict[str, Any]]):
+    """Sends several emails at once over a single connection to the mail
+    server, instead of connecting once per email like :func:`send_email`
+    does. Use this when sending the same kind of email to many users.
+
+    :param messages: A list of dicts, each holding the keyword arguments
+                     that would be passed to :func:`send_email`.
+    """
+    with mail.connect() as conn:
+        for message in messages:
+            conn.send(_build_message(**message))
+
+
 def send_email(
     subject: str,
     recipients: list[str | tuple[str, str]],
@@ -74,7 +88,17 @@ def send_email(
                    If no sender is given, it will fall back to the one you
                    have configured with ``MAIL_DEFAULT_SENDER``.
     """
+    mail.send(_build_message(subject, recipients, text_body, html_body, sender))
+
+
+def _build_message(
+    subject: str,
+    recipients: list[str | tuple[str, str]],
+    text_body: str,
+    html_body: str,
+    sender: str | tuple[str, str] | None = None,
+) -> Message:
     msg = Message(subject, recipients=recipients, sender=sender)
     msg.body = text_body
     msg.html = html_body
-    mail.send(msg)
+    return msg
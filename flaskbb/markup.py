@@ -11,13 +11,16 @@ A module for all markup related stuff.
 import logging
 import re
 from collections.abc import Callable, Iterable
+from functools import lru_cache
 from typing import Any, override
-from urllib.parse import urlparse
+from urllib.parse import quote, urlparse
 
 import mistune
-from flask import Flask, request, url_for
+from flask import Flask, g, request, url_for
 from flask_login import current_user
-from markupsafe import Markup
+from markupsafe import escape, Markup
+from mistune.core import InlineState
+from mistune.inline_parser import InlineParser
 from mistune.plugins import PluginRef
 from mistune.plugins.abbr import abbr
 from mistune.plugins.def_list import def_list
@@ -37,41 +40,85 @@ from mistune.plugins.url import url
 from pluggy import HookimplMarker
 from pygments import highlight
 from pygments.formatters import HtmlFormatter
+from pygments.lexer import Lexer
 from pygments.lexers import get_lexer_by_name
 from pygments.util import ClassNotFound
 
 from flaskbb.core.settings import flaskbb_config
+from flaskbb.deprecation import deprecated
 from flaskbb.extensions import pluggy
 
 impl = HookimplMarker("flaskbb")
 
 logger = logging.getLogger(__name__)
 
-# MENTION_PATTERN = r"@(?:(?<!\\)(?:\\\\)*\\|\w+|\\ \.)(?: |$|)"
+# The lookbehind sits after the "@" so that mistune can still tell which
+# character starts a mention (a leading \B would turn off its fast text scan)
+MENTION_PATTERN = r"@(?<!\w@)(?P<mention_username>[\w\-]+)"
+# Only used by the deprecated process_mentions
 MENTION_REGEX = re.compile(r"\B@([\w\-]+)")
+_MENTION_PLACEHOLDER = "__flaskbb_mention__"
 
 
+def _profile_url_template() -> str:
+    """Builds the profile URL once per request with a placeholder in place
+    of the username, so that mentions don't have to go through the URL
+    map for every single match.
+    """
+    template = g.get("_mention_url_template")
+    if template is None:
+        template = url_for("user.profile", username=_MENTION_PLACEHOLDER, _external=False)
+        g._mention_url_template = template
+    return template
+
+
+def _mention_url(username: str) -> str:
+    return _profile_url_template().replace(_MENTION_PLACEHOLDER, quote(username, safe=""))
+
+
+def _mention_linktag(m: re.Match[str]) -> str:
+    return f"[{m.group(0)}]({_mention_url(m.group(1))})"
+
+
+@deprecated("Mentions are parsed by the inline rule registered in plugin_mention.")
 def replace_mention_with_linktag(m: re.Match[str]) -> str:
-    username = m.group(1)
-    url = url_for("user.profile", username=username, _external=False)
-    return f"[{m.group(0)}]({url})"
+    return _mention_linktag(m)
 
 
+@deprecated("Mentions are parsed by the inline rule registered in plugin_mention.")
 def process_mentions(md: mistune.Markdown, state: mistune.BlockState):
-    state.src = MENTION_REGEX.sub(replace_mention_with_linktag, state.src)
+    if "@" not in state.src:
+        return
+    state.src = MENTION_REGEX.sub(_mention_linktag, state.src)
+
+
+def parse_mention(inline: InlineParser, m: re.Match[str], state: InlineState) -> int:
+    text = m.group(0)
+    if state.in_link:
+        inline.process_text(text, state)
+        return m.end()
+
+    state.append_token(
+        {
+            "type": "link",
+            "children": [{"type": "text", "raw": text}],
+            "attrs": {"url": _mention_url(m.group("mention_username"))},
+        }
+    )
+    return m.end()
 
 
 def plugin_mention(md: mistune.Markdown):
     """
     Mistune plugin to parse @username mentions and convert them
-    to [@username](/user/username) tags.
-    I couldn't get it to work otherwise. If anyone knows a better way
-    or knows regex better feel free to open a PR :)
+    to links to the user's profile. Mentions are an inline rule, so they
+    are found in the same pass as all other inline markup and are left
+    alone inside code and links.
     """
-    md.before_parse_hooks.append(process_mentions)
+    md.inline.register("mention", MENTION_PATTERN, parse_mention, before="link")
 
 
-DEFAULT_PLUGINS = [
+DEFAULT_PLUGINS = (
     plugin_mention,
     url,
     strikethrough,
@@ -86,7 +133,22 @@ DEFAULT_PLUGINS = [
     table,
     footnotes,
     speedup,
-]
+)
+
+
+# Characters that may start any markdown (or mention/url plugin) syntax.
+# Text without any of them renders as a single, escaped paragraph.
+_MARKDOWN_SIGNIFICANT = frozenset("*_`~^=+-#|[]<>\\&@:\r\n\t")
+
+_HTML_FORMATTER = HtmlFormatter()  # pyright: ignore
+
+
+@lru_cache(maxsize=64)
+def _get_lexer(info: str) -> Lexer | None:
+    try:
+        return get_lexer_by_name(info, stripall=True)
+    except ClassNotFound:
+        return None
 
 
 def should_open_in_new_tab() -> bool:
@@ -103,17 +165,10 @@ class FlaskBBRenderer(mistune.HTMLRenderer):
 
     @override
     def block_code(self, code: str, info: str | None = None) -> str:
-        if info:
-            try:
-                lexer = get_lexer_by_name(info, stripall=True)
-            except ClassNotFound:
-                lexer = None
-        else:
-            lexer = None
+        lexer = _get_lexer(info) if info else None
         if not lexer:
-            return f"\n<pre><code>{mistune.escape(code)}</code></pre>\n"
-        formatter = HtmlFormatter()  # pyright: ignore
-        return highlight(code, lexer, formatter)
+            return f"\n<pre><code>{escape(code)}</code></pre>\n"
+        return highlight(code, lexer, _HTML_FORMATTER)
 
     @override
     def link(self, text: str, url: str, title: str | None = None) -> str:
@@ -143,26 +198,72 @@ def flaskbb_load_nonpost_markdown_class():
 
 @impl
 def flaskbb_jinja_directives(app: Flask):
+    # The hooks modify the plugin lists in place. If they end up with the same
+    # renderer classes and plugins, both filters share one markdown instance.
     render_classes = pluggy.hook.flaskbb_load_post_markdown_class(app=app)
-    plugins = DEFAULT_PLUGINS[:]
+    plugins = list(DEFAULT_PLUGINS)
     pluggy.hook.flaskbb_load_post_markdown_plugins(plugins=plugins, app=app)
     app.jinja_env.filters["markup"] = make_renderer(render_classes, plugins)
 
     render_classes = pluggy.hook.flaskbb_load_nonpost_markdown_class(app=app)
-    plugins = DEFAULT_PLUGINS[:]
-    plugins = pluggy.hook.flaskbb_load_nonpost_markdown_plugins(plugins=plugins, app=app)
+    plugins = list(DEFAULT_PLUGINS)
+    pluggy.hook.flaskbb_load_nonpost_markdown_plugins(plugins=plugins, app=app)
     app.jinja_env.filters["nonpost_markup"] = make_renderer(render_classes, plugins)
 
 
-def make_renderer(
-    classes: tuple[type] | list[type], plugins: Iterable[PluginRef] | None = None
-) -> Callable[[str], Markup]:
-    RenderCls = type("FlaskBBRenderer", tuple(classes), {})
+@lru_cache(maxsize=16)
+def _build_markdown(
+    classes: tuple[type, ...], plugins: tuple[PluginRef, ...] | None
+) -> mistune.Markdown:
+    """Creates the markdown instance for a renderer class and plugin chain.
+    Cached so that identical combinations (e.g. the markdown preview, which
+    asks for a renderer without plugins on every request) share one
+    instance instead of rebuilding the renderer class and the plugin rules
+    every time. Plugins that aren't hashable can't be cached, see
+    :func:`make_renderer`.
+    """
+    RenderCls = type("FlaskBBRenderer", classes, {})
 
-    markup = mistune.create_markdown(
+    return mistune.create_markdown(
         renderer=RenderCls(),  # pyright: ignore
-        plugins=plugins,
+        plugins=list(plugins) if plugins is not None else None,
         escape=True,
         hard_wrap=True,
     )
-    return lambda text: Markup(markup(text))
+
+
+def make_renderer(
+    classes: tuple[type] | list[type], plugins: Iterable[PluginRef] | None = None
+) -> Callable[[str], Markup]:
+    classes_key = tuple(classes)
+    plugins_key = tuple(plugins) if plugins is not None else None
+    try:
+        hash((classes_key, plugins_key))
+    except TypeError:
+        # e.g. a plugin that is an instance of an (unfrozen) dataclass
+        markup = _build_markdown.__wrapped__(classes_key, plugins_key)
+    else:
+        markup = _build_markdown(classes_key, plugins_key)
+
+    # Custom renderers and plugins might act on plain text as well, so
+    # skipping the parser is only safe for the default render chain.
+    if classes_key != (FlaskBBRenderer,) or not all(
+        p in DEFAULT_PLUGINS for p in plugins_key or ()
+    ):
+        return lambda text: Markup(markup(text))
+
+    def render(text: str) -> Markup:
+        if _is_plain_text(text):
+            return Markup(f"<p>{mistune.escape(text)}</p>\n")
+        return Markup(markup(text))
+
+    return render
+
+
+def _is_plain_text(text: str) -> bool:
+    return (
+        bool(text)
+        and _MARKDOWN_SIGNIFICANT.isdisjoint(text)
+        and not text[0].isdigit()
+        and text == text.strip()
+    )
@@ -374,7 +374,7 @@ def flaskbb_load_post_markdown_plugins(plugins, app):
         :data:`~flaskbb.markup.plugin_userify`
             FlaskBB-provided plugin that links user mentions to their profiles.
         :data:`~flaskbb.markup.DEFAULT_PLUGINS`
-            List of plugins loaded by default.
+            Tuple of plugins loaded by default.
         :func:`flaskbb_load_nonpost_markdown_plugins`
             Hook to modify the list of plugins for markdown rendering in
             non-post areas.
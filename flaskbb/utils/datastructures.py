@@ -23,7 +23,8 @@ class TemplateEventResult(list[object]):
         list.__init__(self, items)
 
     def __unicode__(self):
-        return "".join(map(str, self))
+        # hook results are mostly rendered strings already
+        return "".join(x if type(x) is str else str(x) for x in self)
 
     @override
     def __str__(self):
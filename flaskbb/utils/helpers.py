@@ -105,7 +105,7 @@ def redirect_url(endpoint: str | None, use_referrer: bool = True):
     :param endpoint: The trusted fallback URL to redirect to (e.g. built
         with ``url_for``). If not provided 'forum.index' will be used.
     """
-    allowed_hosts: list[str] = current_app.config["ALLOWED_HOSTS"]
+    allowed_hosts: frozenset[str] = current_app.config["ALLOWED_HOSTS"]
     targets = [request.args.get("next"), request.referrer if use_referrer else None]
     return get_first_safe_redirect_url(
         *targets,
@@ -12,6 +12,7 @@ Note: Most of this code has been taken from Django 3.2.0.alpha0.
 """
 
 import unicodedata
+from collections.abc import Iterable
 from urllib.parse import urlparse
 
 # Mirrors the WHATWG URL spec's "C0 control or space" trim (applied at both
@@ -21,6 +22,11 @@ from urllib.parse import urlparse
 _C0_CONTROL_OR_SPACE = "".join(chr(i) for i in range(0x21))  # \x00-\x20 inclusive
 _ASCII_TAB_OR_NEWLINE = ("\t", "\r", "\n")
 
+_BACKSLASH_TO_SLASH = str.maketrans("\\", "/")
+
+_HTTP_SCHEMES = frozenset(("http", "https"))
+_HTTPS_ONLY = frozenset(("https",))
+
 
 def _normalize_url(url: str) -> str:
     """
@@ -38,7 +44,7 @@ def _normalize_url(url: str) -> str:
 
 
 def _url_has_allowed_host_and_scheme(
-    url: str, allowed_hosts: set[str], require_https: bool = False
+    url: str, allowed_hosts: frozenset[str], require_https: bool = False
 ):
     # Sanitize the url:
     # - the "///" prefix check
@@ -63,22 +69,53 @@ def _url_has_allowed_host_and_scheme(
         return False
     # Forbid URLs that start with control characters. Some browsers (like
     # Chrome) ignore quite a few control characters at the start of a
-    # URL and might consider the URL as scheme relative.
-    if unicodedata.category(url[0])[0] == "C":
+    # URL and might consider the URL as scheme relative. Only non-ASCII
+    # characters need the (slower) lookup in the unicode database.
+    first = url[0]
+    if (
+        first < "\x20"
+        or first == "\x7f"
+        or (first > "\x7f" and unicodedata.category(first)[0] == "C")
+    ):
         return False
     scheme = url_info.scheme
     # Consider URLs without a scheme (e.g. //example.com/p) to be http.
     if not url_info.scheme and url_info.netloc:
         scheme = "http"
-    valid_schemes = ["https"] if require_https else ["http", "https"]
-    return (not url_info.netloc or url_info.netloc in allowed_hosts) and (
+    valid_schemes = _HTTPS_ONLY if require_https else _HTTP_SCHEMES
+    return (not url_info.netloc or url_info.netloc.lower() in allowed_hosts) and (
         not scheme or scheme in valid_schemes
     )
 
 
+class _CanonicalHosts(frozenset[str]):
+    """Marks a set of hosts that has already been lowercased."""
+
+
+def canonical_hosts(
+    allowed_hosts: frozenset[str] | set[str] | list[str] | str | None,
+) -> frozenset[str]:
+    """
+    Return ``allowed_hosts`` as a frozenset of lowercased hosts, which is
+    the form the redirect checks compare against. Sets returned by this
+    function are passed through as-is, so converting the hosts once (e.g.
+    the ``ALLOWED_HOSTS`` config when the app is configured) spares the
+    conversion on every redirect.
+    """
+    if isinstance(allowed_hosts, _CanonicalHosts):
+        return allowed_hosts
+    if allowed_hosts is None:
+        hosts: Iterable[str] = ()
+    elif isinstance(allowed_hosts, str):
+        hosts = (allowed_hosts,)
+    else:
+        hosts = allowed_hosts
+    return _CanonicalHosts(host.lower() for host in hosts)
+
+
 def get_safe_redirect_url(
     url: str | None,
-    allowed_hosts: set[str] | list[str] | str | None,
+    allowed_hosts: frozenset[str] | set[str] | list[str] | str | None,
     fallback: str | None = None,
     require_https: bool = False,
 ) -> str | None:
@@ -95,29 +132,26 @@ def get_safe_redirect_url(
     if not url:
         return fallback
 
+    allowed_hosts = canonical_hosts(allowed_hosts)
     normalized = _normalize_url(url)
-    normalized_backslashes = _normalize_url(url.replace("\\", "/"))
+    if not _url_has_allowed_host_and_scheme(normalized, allowed_hosts, require_https=require_https):
+        return fallback
 
-    if allowed_hosts is None:
-        allowed_hosts = set()
-    elif isinstance(allowed_hosts, str):
-        allowed_hosts = {allowed_hosts}
-    elif isinstance(allowed_hosts, list):
-        allowed_hosts = set(allowed_hosts)
-
-    if _url_has_allowed_host_and_scheme(
-        normalized, allowed_hosts, require_https=require_https
-    ) and _url_has_allowed_host_and_scheme(
-        normalized_backslashes, allowed_hosts, require_https=require_https
+    # Browsers treat backslashes like forward slashes, so the URL has to be
+    # safe in that reading too. Without any backslash both are the same URL.
+    if "\\" in url and not _url_has_allowed_host_and_scheme(
+        _normalize_url(url.translate(_BACKSLASH_TO_SLASH)),
+        allowed_hosts,
+        require_https=require_https,
     ):
-        return normalized
+        return fallback
 
-    return fallback
+    return normalized
 
 
 def get_first_safe_redirect_url(
     *candidates: str | None,
-    allowed_hosts: set[str] | list[str] | str | None,
+    allowed_hosts: frozenset[str] | set[str] | list[str] | str | None,
     fallback: str,
     require_https: bool = False,
 ) -> str:
@@ -129,6 +163,7 @@ def get_first_safe_redirect_url(
     is trusted and is NOT re-validated. Callers must pass something known
     to be safe (e.g. ``url_for("some.view")``), never user input.
     """
+    allowed_hosts = canonical_hosts(allowed_hosts)
     for candidate in candidates:
         if not candidate:
             continue
@@ -10,7 +10,6 @@ This module contains the translation Domain used by FlaskBB.
 
 import logging
 import os
-import subprocess
 from typing import override
 
 import babel
@@ -33,6 +32,13 @@ class FlaskBBDomain(Domain):
         with self.app.app_context():
             self.plugin_translations = pluggy.hook.flaskbb_load_translations()
 
+        # Neither of these change while the app is running, so there is no
+        # need to resolve them again for every locale that gets loaded.
+        self._translations_path = self.get_translations_path(self.app)
+        self._active_plugin_translations = [
+            plugin for plugin in self.plugin_translations if os.path.isdir(plugin)
+        ]
+
     @override
     def get_translations(self):
         """Returns the correct gettext translations that should be used for
@@ -51,10 +57,11 @@ class FlaskBBDomain(Domain):
 
         # load them into the cache
         if translations is None:
-            dirname = self.get_translations_path(state.app)
-            translations = babel.support.Translations.load(dirname, locale, domain=self.domain)
+            translations = babel.support.Translations.load(
+                self._translations_path, locale, domain=self.domain
+            )
             # now load and add the plugin translations
-            for plugin in self.plugin_translations:
+            for plugin in self._active_plugin_translations:
                 logger.debug(f"Loading plugin translation from: {plugin}")
                 plugin_translation = babel.support.Translations.load(
                     dirname=plugin, locales=locale, domain="messages"
@@ -68,6 +75,46 @@ class FlaskBBDomain(Domain):
         return translations
 
 
+def _pybabel(*args: str) -> int:
+    """Runs a ``pybabel`` command in the current interpreter instead of
+    spawning a new process for it.
+
+    Failures are logged instead of raised, so that e.g. a plugin without
+    any catalogs doesn't abort the remaining commands. Returns the exit
+    status the ``pybabel`` executable would have exited with.
+    """
+    # babel's CLI pulls in quite a few modules that are only needed by the
+    # translation commands, so don't load it along with the app
+    from babel.messages.frontend import BaseError, CommandLineInterface
+
+    # pybabel configures the process-wide 'babel' logger for its output,
+    # which must not leak into the rest of the application.
+    babel_logger = logging.getLogger("babel")
+    level = babel_logger.level
+    handlers = list(babel_logger.handlers)
+    handler_config = [(handler.level, handler.formatter) for handler in handlers]
+
+    try:
+        return CommandLineInterface().run(["pybabel", *args]) or 0
+    except BaseError as e:
+        logger.error(f"pybabel {args[0]} failed: {e}")
+        return 1
+    except SystemExit as e:
+        # raised by pybabel's option parser, e.g. on invalid arguments
+        if not isinstance(e.code, int):
+            logger.error(f"pybabel {args[0]} failed: {e.code}")
+            return 1
+        if e.code:
+            logger.error(f"pybabel {args[0]} exited with status {e.code}")
+        return e.code or 0
+    finally:
+        babel_logger.setLevel(level)
+        babel_logger.handlers = handlers
+        for handler, (handler_level, formatter) in zip(handlers, handler_config, strict=True):
+            handler.setLevel(handler_level)
+            handler.setFormatter(formatter)
+
+
 def update_translations(include_plugins: bool = False):
     """Updates all translations.
 
@@ -77,20 +124,8 @@ def update_translations(include_plugins: bool = False):
     translations_folder = os.path.join(current_app.root_path, "translations")
     source_file = os.path.join(translations_folder, "messages.pot")
 
-    subprocess.call(
-        [
-            "pybabel",
-            "extract",
-            "-F",
-            "babel.cfg",
-            "-k",
-            "lazy_gettext",
-            "-o",
-            source_file,
-            ".",
-        ]
-    )
-    subprocess.call(["pybabel", "update", "-i", source_file, "-d", translations_folder])
+    _pybabel("extract", "-F", "babel.cfg", "-k", "lazy_gettext", "-o", source_file, ".")
+    _pybabel("update", "-i", source_file, "-d", translations_folder)
 
     if include_plugins:
         for plugin in pluggy.list_name():
@@ -106,31 +141,8 @@ def add_translations(translation: str):
     translations_folder = os.path.join(current_app.root_path, "translations")
     source_file = os.path.join(translations_folder, "messages.pot")
 
-    subprocess.call(
-        [
-            "pybabel",
-            "extract",
-            "-F",
-            "babel.cfg",
-            "-k",
-            "lazy_gettext",
-            "-o",
-            source_file,
-            ".",
-        ]
-    )
-    subprocess.call(
-        [
-            "pybabel",
-            "init",
-            "-i",
-            source_file,
-            "-d",
-            translations_folder,
-            "-l",
-            translation,
-        ]
-    )
+    _pybabel("extract", "-F", "babel.cfg", "-k", "lazy_gettext", "-o", source_file, ".")
+    _pybabel("init", "-i", source_file, "-d", translations_folder, "-l", translation)
 
 
 def compile_translations(include_plugins: bool = False):
@@ -140,7 +152,7 @@ def compile_translations(include_plugins: bool = False):
                             translations for all plugins.
     """
     translations_folder = os.path.join(current_app.root_path, "translations")
-    subprocess.call(["pybabel", "compile", "-d", translations_folder])
+    _pybabel("compile", "-d", translations_folder)
 
     if include_plugins:
         for plugin in pluggy.list_name():
@@ -157,31 +169,17 @@ def add_plugin_translations(plugin: str, translation: str):
     translations_folder = os.path.join(pluggy.get_plugin_path(plugin), "translations")
     source_file = os.path.join(translations_folder, "messages.pot")
 
-    subprocess.call(
-        [
-            "pybabel",
-            "extract",
-            "-F",
-            "babel.cfg",
-            "-k",
-            "lazy_gettext",
-            "-o",
-            source_file,
-            pluggy.get_plugin_path(plugin),
-        ]
-    )
-    subprocess.call(
-        [
-            "pybabel",
-            "init",
-            "-i",
-            source_file,
-            "-d",
-            translations_folder,
-            "-l",
-            translation,
-        ]
+    _pybabel(
+        "extract",
+        "-F",
+        "babel.cfg",
+        "-k",
+        "lazy_gettext",
+        "-o",
+        source_file,
+        pluggy.get_plugin_path(plugin),
     )
+    _pybabel("init", "-i", source_file, "-d", translations_folder, "-l", translation)
 
 
 def update_plugin_translations(plugin: str):
@@ -196,20 +194,17 @@ def update_plugin_translations(plugin: str):
     if not os.path.exists(source_file):
         return False
 
-    subprocess.call(
-        [
-            "pybabel",
-            "extract",
-            "-F",
-            "babel.cfg",
-            "-k",
-            "lazy_gettext",
-            "-o",
-            source_file,
-            pluggy.get_plugin_path(plugin),
-        ]
+    _pybabel(
+        "extract",
+        "-F",
+        "babel.cfg",
+        "-k",
+        "lazy_gettext",
+        "-o",
+        source_file,
+        pluggy.get_plugin_path(plugin),
     )
-    subprocess.call(["pybabel", "update", "-i", source_file, "-d", translations_folder])
+    _pybabel("update", "-i", source_file, "-d", translations_folder)
 
 
 def compile_plugin_translations(plugin: str):
@@ -223,4 +218,4 @@ def compile_plugin_translations(plugin: str):
     if not os.path.exists(translations_folder):
         return False
 
-    subprocess.call(["pybabel", "compile", "-d", translations_folder])
+    _pybabel("compile", "-d", translations_folder)
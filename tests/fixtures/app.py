@@ -1,4 +1,5 @@
 import pytest
+from flask import g
 from flaskbb import create_app
 from flaskbb.configs.testing import TestingConfig as Config
 from flaskbb.extensions import cache, db
@@ -30,9 +31,12 @@ def clear_cache(application):
     repr, which is just ``<User username>``. Fixture usernames repeat across
     tests, so a cached entry from one test would otherwise be served to the
     next one - with whatever groups the earlier test happened to assign.
+    The same goes for the settings ``flaskbb_config`` keeps on ``g``, as
+    every request context shares the package-wide app context.
     """
     yield
     cache.clear()
+    g.pop("_flaskbb_settings", None)
 
 
 @pytest.fixture()
@@ -1,5 +1,5 @@
 from flask import current_app
-from flaskbb.email import send_activation_token, send_reset_token
+from flaskbb.email import send_activation_token, send_email_batch, send_reset_token
 from flaskbb.extensions import mail
 
 
@@ -27,3 +27,22 @@ def test_send_activation_token_to_user(default_settings, user):
             # from /auth/activate/<token>
             assert "/auth/activate" in outbox[0].body
             assert "/auth/activate" in outbox[0].html
+
+
+def test_send_email_batch(default_settings):
+    messages = [
+        {
+            "subject": "Hello",
+            "recipients": [f"user{i}@example.org"],
+            "text_body": "Hello",
+            "html_body": "<p>Hello</p>",
+        }
+        for i in range(3)
+    ]
+
+    with current_app.test_request_context():
+        with mail.record_messages() as outbox:
+            send_email_batch(messages)
+
+            assert len(outbox) == 3
+            assert [m.recipients for m in outbox] == [[f"user{i}@example.org"] for i in range(3)]
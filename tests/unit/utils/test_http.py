@@ -3,6 +3,7 @@ from urllib.parse import parse_qs
 
 from flaskbb.utils.http import (
     _normalize_url,
+    canonical_hosts,
     get_first_safe_redirect_url,
     get_safe_redirect_url,
 )
@@ -165,3 +166,18 @@ def test_secure_param_non_https_urls():
     )
     for url in insecure_urls:
         assert not get_safe_redirect_url(url, allowed_hosts={"example.com"}, require_https=True)
+
+
+def test_hosts_are_case_insensitive():
+    assert get_safe_redirect_url("https://TestServer/", allowed_hosts={"testserver"})
+    assert get_safe_redirect_url("https://testserver/", allowed_hosts=["TestServer"])
+    assert canonical_hosts(["TestServer", "example.com"]) == frozenset(
+        {"testserver", "example.com"}
+    )
+
+
+def test_mixed_case_frozenset_hosts():
+    hosts = frozenset({"Example.com"})
+    assert get_safe_redirect_url("https://Example.com/x", hosts)
+    assert get_safe_redirect_url("https://example.com/x", hosts)
+    assert canonical_hosts(hosts) == frozenset({"example.com"})
@@ -2,7 +2,14 @@ import pytest
 from flask import current_app
 from flask_login import login_user
 from flaskbb.core.settings import flaskbb_config
-from flaskbb.markup import DEFAULT_PLUGINS, FlaskBBRenderer, make_renderer
+from flaskbb.deprecation import RemovedInFlaskBB3
+from flaskbb.markup import (
+    DEFAULT_PLUGINS,
+    FlaskBBRenderer,
+    make_renderer,
+    MENTION_REGEX,
+    replace_mention_with_linktag,
+)
 
 markdown = make_renderer([FlaskBBRenderer], DEFAULT_PLUGINS)
 
@@ -17,6 +24,47 @@ def test_userify():
     assert all(substring in result2 for substring in ("/user/sh4nks", "/user/flaskbb", "/user/wow"))
 
 
+def test_userify_skips_code_and_emails():
+    with current_app.test_request_context():
+        assert "/user/" not in markdown("`@sh4nks`")
+        assert "/user/" not in markdown("mail me at sh4nks@example.org")
+
+
+def test_replace_mention_with_linktag_is_deprecated():
+    with current_app.test_request_context():
+        with pytest.warns(RemovedInFlaskBB3):
+            result = MENTION_REGEX.sub(replace_mention_with_linktag, "hi @sh4nks")
+
+    assert result == "hi [@sh4nks](/user/sh4nks)"
+
+
+def test_plain_text():
+    # plain text skips the markdown parser but renders the same
+    assert markdown("thanks!") == "<p>thanks!</p>\n"
+    assert markdown('a "quoted" word') == "<p>a &quot;quoted&quot; word</p>\n"
+    assert markdown("1. item") == "<ol>\n<li>item</li>\n</ol>\n"
+
+
+def test_unhashable_plugin():
+    class Plugin:
+        __hash__ = None
+
+        def __call__(self, md):
+            pass
+
+    renderer = make_renderer([FlaskBBRenderer], [*DEFAULT_PLUGINS, Plugin()])
+    assert renderer("**bold**") == "<p><strong>bold</strong></p>\n"
+
+
+def test_nonpost_markup(application):
+    # the nonpost filter renders with the default plugins as well
+    nonpost_markup = application.jinja_env.filters["nonpost_markup"]
+    with application.test_request_context():
+        result = nonpost_markup("hi @admin ~~x~~")
+
+    assert result == '<p>hi <a href="/user/admin">@admin</a> <del>x</del></p>\n'
+
+
 def test_highlighting():
     # custom block code with pygments highlighting (jus)
     b_plain = """
@@ -12,3 +12,24 @@ def test_flaskbb_config(default_settings):
     assert flaskbb_config["PROJECT_TITLE"] == "FlaskBBTest"
     # test __iter__
     assert "PROJECT_TITLE" in list(flaskbb_config.__iter__())
+
+
+def test_flaskbb_config_request_cache(default_settings, application):
+    flaskbb_config = FlaskBBConfigProxy()
+
+    with application.test_request_context():
+        assert flaskbb_config["PROJECT_TITLE"] == "FlaskBB"
+        # writes invalidate the copy kept for the current request
+        flaskbb_config["PROJECT_TITLE"] = "FlaskBBTest"
+        assert flaskbb_config["PROJECT_TITLE"] == "FlaskBBTest"
+
+
+def test_flaskbb_config_mapping_views(default_settings):
+    flaskbb_config = FlaskBBConfigProxy()
+
+    assert "PROJECT_TITLE" in flaskbb_config
+    assert "project_title" in flaskbb_config
+    assert "NOT_A_SETTING" not in flaskbb_config
+    assert dict(flaskbb_config.items())["PROJECT_TITLE"] == "FlaskBB"
+    assert list(flaskbb_config.keys()) == list(flaskbb_config)
+    assert len(flaskbb_config.values()) == len(flaskbb_config)
@@ -1,5 +1,9 @@
+import logging
+
 from babel.support import Translations
 from flask import current_app
+from flaskbb.extensions import pluggy
+from flaskbb.utils.translations import _pybabel, compile_plugin_translations
 
 
 def test_flaskbbdomain_translations(default_settings):
@@ -8,3 +12,26 @@ def test_flaskbbdomain_translations(default_settings):
     with current_app.test_request_context():
         assert isinstance(domain.get_translations(), Translations)
         assert len(domain.get_translations_cache()) == 1  # 'en'
+
+
+def test_compile_plugin_translations_without_catalogs(tmp_path, mocker):
+    # a plugin that has only extracted its messages so far
+    translations_folder = tmp_path / "translations"
+    translations_folder.mkdir()
+    (translations_folder / "messages.pot").write_text("")
+    mocker.patch.object(pluggy, "get_plugin_path", return_value=str(tmp_path))
+    babel_logger = logging.getLogger("babel")
+    handlers = list(babel_logger.handlers)
+
+    # pybabel fails, but that must not abort the remaining plugins
+    compile_plugin_translations("no_catalogs")
+
+    assert babel_logger.handlers == handlers
+
+
+def test_pybabel_invalid_arguments():
+    assert _pybabel("compile", "--no-such-option") != 0
+
+
+def test_pybabel_help_exits_cleanly():
+    assert _pybabel("compile", "--help") == 0